@@ -2,21 +2,22 @@
 
 import argparse
 import csv
+import functools
 import os
-import pickle
+import re
 import sys
-import zipfile
-from dataclasses import dataclass
-from datetime import datetime
-from io import TextIOWrapper
-from typing import List, Optional
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from io import BufferedReader, BytesIO, TextIOWrapper
+from itertools import islice
+from operator import attrgetter
+from typing import Iterator, List, NamedTuple, Optional, TextIO, Tuple
 
 
 # -----------------------------
 # Domain Layer
 # -----------------------------
-@dataclass
-class Member:
+class Member(NamedTuple):
     first_name: str
     last_name: str
     email: str
@@ -27,73 +28,336 @@ class Member:
 # -----------------------------
 # Infrastructure Layer
 # -----------------------------
+def _parse_iso_date(date_str: str) -> datetime:
+    # fromisoformat is implemented in C and handles the ISO 8601 dates in
+    # Circle exports far faster than strptime
+    if date_str.endswith("Z"):
+        # Z already means UTC, so parse straight to a naive datetime instead
+        # of building an aware one and converting it back
+        date_str = date_str[:-1]
+    parsed = datetime.fromisoformat(date_str)
+    if parsed.tzinfo is not None:
+        # Join dates are compared as naive UTC throughout
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _strptime_with(fmt: str, date_str: str) -> datetime:
+    return datetime.strptime(date_str, fmt)
+
+
+class DateParser:
+    """
+    Parses the join dates of a single file. Exports normally use one format
+    throughout, so the format that last succeeded is tried first and the
+    others are only probed when it fails. Results are memoized, since many
+    members share the same join timestamp. Row parsing uses parse_or_none so
+    the success path never goes through an exception handler.
+    """
+
+    DATE_FORMATS = (
+        "%Y-%m-%dT%H:%M:%S.%fZ",
+        "%Y-%m-%dT%H:%M:%SZ",
+        "%Y-%m-%d %H:%M:%S",
+        "%Y-%m-%d",  # Fallback format
+    )
+    CACHE_SIZE = 8192
+
+    def __init__(self):
+        self._parsers = [_parse_iso_date] + [
+            functools.partial(_strptime_with, fmt) for fmt in self.DATE_FORMATS
+        ]
+        self._preferred = self._parsers[0]
+        self.parse_or_none = functools.lru_cache(maxsize=self.CACHE_SIZE)(
+            self._parse_or_none
+        )
+
+    def parse(self, date_str: str) -> datetime:
+        """
+        Parses the date string, raising ValueError if no format matches.
+        """
+        parsed = self.parse_or_none(date_str)
+        if parsed is None:
+            raise ValueError(f"Date '{date_str}' is not in a recognized format.")
+        return parsed
+
+    def _parse_or_none(self, date_str: str) -> Optional[datetime]:
+        try:
+            return self._preferred(date_str)
+        except ValueError:
+            pass
+        for parser in self._parsers:
+            if parser is self._preferred:
+                continue
+            try:
+                parsed = parser(date_str)
+            except ValueError:
+                continue
+            self._preferred = parser
+            return parsed
+        # None of the formats match
+        return None
+
+
 class FileHandler:
+    # Read buffer placed in front of the ZIP decompressor
+    ZIP_READ_BUFFER_SIZE = 1 << 20
+    # Entries smaller than this are decompressed into memory in one go
+    ZIP_IN_MEMORY_LIMIT = 128 * 1024 * 1024
+    # Rows parsed per batch when streaming members
+    MEMBER_CHUNK_SIZE = 50_000
+    # Join dates the pandas backend converts itself; anything else is parsed
+    # by DateParser
+    PANDAS_DATE_PATTERN = re.compile(
+        r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d{1,6})?(?:Z|[+-]\d{2}:\d{2})?"
+    )
+
+    @staticmethod
+    def file_extension(path: str) -> str:
+        # Lowercases only the extension rather than the whole path
+        return os.path.splitext(path)[1].lower()
+
+    @staticmethod
+    @contextmanager
+    def open_csv(file_path: str) -> Iterator[TextIO]:
+        """
+        Opens the members CSV, either directly or from inside a ZIP archive.
+        The underlying files stay open until the context exits.
+        """
+        extension = FileHandler.file_extension(file_path)
+        if extension == ".zip":
+            with FileHandler.extract_csv_from_zip(file_path) as csv_file:
+                yield csv_file
+        elif extension == ".csv":
+            try:
+                csv_file = open(file_path, "r", newline="", encoding="utf-8")
+            except FileNotFoundError:
+                raise FileNotFoundError(f"CSV file '{file_path}' not found.")
+            with csv_file:
+                yield csv_file
+        else:
+            raise ValueError("Input file must be a ZIP or CSV file.")
+
     @staticmethod
-    def extract_csv_from_zip(zip_path: str) -> TextIOWrapper:
+    @contextmanager
+    def extract_csv_from_zip(zip_path: str) -> Iterator[TextIO]:
+        import zipfile
+
         try:
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                # Find the first CSV file in the ZIP
-                csv_files = [
-                    f for f in zip_ref.namelist() if f.lower().endswith(".csv")
-                ]
-                if not csv_files:
-                    raise FileNotFoundError("No CSV file found inside the ZIP archive.")
-                csv_filename = csv_files[0]
-                return TextIOWrapper(zip_ref.open(csv_filename), encoding="utf-8")
+            zip_ref = zipfile.ZipFile(zip_path, "r")
         except zipfile.BadZipFile:
             raise ValueError("The provided file is not a valid ZIP archive.")
+        # Keep the archive open for as long as the CSV stream is being read
+        with zip_ref:
+            # Find the first CSV file in the ZIP
+            csv_files = [
+                f for f in zip_ref.namelist() if FileHandler.file_extension(f) == ".csv"
+            ]
+            if not csv_files:
+                raise FileNotFoundError("No CSV file found inside the ZIP archive.")
+            csv_filename = csv_files[0]
+            file_size = zip_ref.getinfo(csv_filename).file_size
+            if file_size < FileHandler.ZIP_IN_MEMORY_LIMIT:
+                raw = BytesIO(zip_ref.read(csv_filename))
+            else:
+                # Buffer decompressed bytes in large blocks so the csv reader
+                # doesn't drive zlib through many small reads
+                raw = BufferedReader(
+                    zip_ref.open(csv_filename),
+                    buffer_size=FileHandler.ZIP_READ_BUFFER_SIZE,
+                )
+            with TextIOWrapper(raw, encoding="utf-8", newline="") as csv_file:
+                yield csv_file
 
     @staticmethod
     def parse_members(csv_file) -> List[Member]:
-        reader = csv.DictReader(csv_file)
         members = []
-        for row in reader:
+        for _, chunk in FileHandler.select_members_chunked(csv_file, None):
+            members.extend(chunk)
+        return members
+
+    @staticmethod
+    def select_members_chunked(
+        csv_file,
+        joined_after: Optional[datetime],
+        chunk_size: int = MEMBER_CHUNK_SIZE,
+        use_pandas: bool = False,
+    ) -> Iterator[Tuple[int, List[Member]]]:
+        """
+        Reads the CSV in chunks of at most chunk_size rows and yields the number
+        of rows read alongside the members that joined after joined_after (all
+        of them when it is None). Rows are filtered on their join date before
+        any Member objects are created.
+
+        The csv module is used unless use_pandas is set. pandas is optional and
+        is not faster for typical exports once its import time is counted.
+        """
+        if use_pandas:
             try:
-                join_date = FileHandler.parse_date(row["Join Date"])
-            except ValueError as ve:
-                raise ValueError(f"Invalid date format in row: {row}") from ve
-            member = Member(
-                first_name=row.get("First Name", "").strip(),
-                last_name=row.get("Last Name", "").strip(),
-                email=row.get("Email", "").strip(),
-                join_date=join_date,
-                profile_url=row.get("Profile URL", "").strip(),
+                import pandas  # noqa: F401
+            except ImportError:
+                raise ValueError("Reading with pandas requires pandas to be installed.")
+            return FileHandler._iter_member_chunks_pandas(
+                csv_file, joined_after, chunk_size, DateParser()
             )
-            members.append(member)
+        return FileHandler._iter_member_chunks_csv(
+            csv_file, joined_after, chunk_size, DateParser()
+        )
+
+    @staticmethod
+    def _iter_member_chunks_pandas(
+        csv_file,
+        joined_after: Optional[datetime],
+        chunk_size: int,
+        date_parser: DateParser,
+    ) -> Iterator[Tuple[int, List[Member]]]:
+        """
+        Reads the CSV with the pandas C parser and converts and filters each
+        chunk's Join Date column at once. Only plain ISO 8601 timestamps are
+        converted by pandas; every other value goes through the DateParser,
+        so both backends accept, reject and report the same rows.
+        """
+        import pandas as pd
+
+        try:
+            chunks = pd.read_csv(
+                csv_file, dtype=str, keep_default_na=False, chunksize=chunk_size
+            )
+        except pd.errors.EmptyDataError:
+            return
+        with chunks:
+            for df in chunks:
+                yield len(df), FileHandler._members_from_frame(
+                    df, joined_after, date_parser
+                )
+
+    @staticmethod
+    def _members_from_frame(
+        df, joined_after: Optional[datetime], date_parser: DateParser
+    ) -> List[Member]:
+        import pandas as pd
+
+        if "Join Date" not in df.columns:
+            raise ValueError("Input CSV is missing the 'Join Date' column.")
+
+        # Column work is done on plain lists; pandas' per-element string
+        # methods are no faster and add overhead
+        match = FileHandler.PANDAS_DATE_PATTERN.fullmatch
+        plain = [match(value) is not None for value in df["Join Date"].tolist()]
+        # Offsets are converted to UTC and then dropped, matching the naive UTC
+        # datetimes DateParser returns
+        join_dates = pd.to_datetime(
+            df["Join Date"].where(plain), format="ISO8601", utc=True, errors="coerce"
+        ).dt.tz_localize(None)
+        if joined_after is not None:
+            # Unconverted (NaT) rows are kept and decided by DateParser below
+            keep = join_dates.isna() | (join_dates > joined_after)
+            df = df[keep]
+            join_dates = join_dates[keep]
+
+        # Whole-column conversions; NaT becomes None
+        dates = join_dates.to_numpy(dtype="datetime64[us]").tolist()
+        raw_dates = df["Join Date"].tolist()
+        skipped = False
+        for position, join_date in enumerate(dates):
+            if join_date is not None:
+                continue
+            join_date = date_parser.parse_or_none(raw_dates[position])
+            if join_date is None:
+                row = dict(zip(df.columns, df.iloc[position]))
+                raise ValueError(f"Invalid date format in row: {row}")
+            if joined_after is not None and join_date <= joined_after:
+                skipped = True
+                join_date = None
+            dates[position] = join_date
+
+        empty = [""] * len(df)
+        first_names, last_names, emails, profile_urls = [
+            (
+                [value.strip() for value in df[name].tolist()]
+                if name in df.columns
+                else empty
+            )
+            for name in ("First Name", "Last Name", "Email", "Profile URL")
+        ]
+        members = list(
+            map(Member, first_names, last_names, emails, dates, profile_urls)
+        )
+        if skipped:
+            members = [member for member in members if member.join_date is not None]
         return members
 
+    @staticmethod
+    def _iter_member_chunks_csv(
+        csv_file,
+        joined_after: Optional[datetime],
+        chunk_size: int,
+        date_parser: DateParser,
+    ) -> Iterator[Tuple[int, List[Member]]]:
+        reader = csv.reader(csv_file)
+        header = next(reader, None)
+        if header is None:
+            return
+        if "Join Date" not in header:
+            raise ValueError("Input CSV is missing the 'Join Date' column.")
+
+        # Resolve column positions once; optional columns fall back to ""
+        join_date_idx = header.index("Join Date")
+        field_indices = [
+            header.index(name) if name in header else None
+            for name in ("First Name", "Last Name", "Email", "Profile URL")
+        ]
+
+        # Blank lines come through as empty lists
+        rows = filter(None, reader)
+        while True:
+            batch = list(islice(rows, chunk_size))
+            if not batch:
+                return
+            members = []
+            for row in batch:
+                join_date = (
+                    date_parser.parse_or_none(row[join_date_idx])
+                    if join_date_idx < len(row)
+                    else None
+                )
+                if join_date is None:
+                    raise ValueError(
+                        f"Invalid date format in row: {dict(zip(header, row))}"
+                    )
+                if joined_after is not None and join_date <= joined_after:
+                    continue
+                first_name, last_name, email, profile_url = [
+                    row[i].strip() if i is not None and i < len(row) else ""
+                    for i in field_indices
+                ]
+                members.append(
+                    Member(first_name, last_name, email, join_date, profile_url)
+                )
+            yield len(batch), members
+
     @staticmethod
     def parse_date(date_str: str) -> datetime:
         """
         Attempts to parse the date string using multiple formats.
         Raises ValueError if none of the formats match.
         """
-        date_formats = [
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%dT%H:%M:%S.%fZ",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%d",  # Fallback format
-        ]
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-        # If none of the formats match, raise an error
-        raise ValueError(f"Date '{date_str}' is not in a recognized format.")
+        return DateParser().parse(date_str)
 
 
 class CacheHandler:
-    CACHE_FILE = "last_join_date.pkl"
+    CACHE_FILE = "last_join_date.txt"
 
     @staticmethod
     def load_last_join_date() -> Optional[datetime]:
         if not os.path.exists(CacheHandler.CACHE_FILE):
             return None
         try:
-            with open(CacheHandler.CACHE_FILE, "rb") as f:
-                return pickle.load(f)
-        except (pickle.UnpicklingError, EOFError):
+            with open(CacheHandler.CACHE_FILE, "r", encoding="utf-8") as f:
+                # Normalized like parsed join dates, so a cache holding an
+                # offset still compares as naive UTC
+                return _parse_iso_date(f.read().strip())
+        except ValueError:
             print(
                 "Warning: Cache file is corrupted. It will be ignored.", file=sys.stderr
             )
@@ -101,57 +365,52 @@ class CacheHandler:
 
     @staticmethod
     def save_last_join_date(join_date: datetime):
-        with open(CacheHandler.CACHE_FILE, "wb") as f:
-            pickle.dump(join_date, f)
+        with open(CacheHandler.CACHE_FILE, "w", encoding="utf-8") as f:
+            f.write(join_date.isoformat())
 
 
 # -----------------------------
 # Application Layer
 # -----------------------------
 class MemberProcessor:
-    def __init__(self, file_path: str, reference_date: Optional[datetime] = None):
+    def __init__(
+        self,
+        file_path: str,
+        reference_date: Optional[datetime] = None,
+        use_pandas: bool = False,
+    ):
         self.file_path = file_path
         self.file_handler = FileHandler()
         self.cache_handler = CacheHandler()
         self.provided_reference_date = reference_date
+        self.use_pandas = use_pandas
 
     def process(self) -> List[Member]:
-        # Determine if input is ZIP or CSV
-        if self.file_path.lower().endswith(".zip"):
-            csv_file = self.file_handler.extract_csv_from_zip(self.file_path)
-        elif self.file_path.lower().endswith(".csv"):
-            try:
-                csv_file = open(self.file_path, "r", encoding="utf-8")
-            except FileNotFoundError:
-                raise FileNotFoundError(f"CSV file '{self.file_path}' not found.")
-        else:
-            raise ValueError("Input file must be a ZIP or CSV file.")
-
-        with csv_file:
-            all_members = self.file_handler.parse_members(csv_file)
-
-        if self.provided_reference_date:
-            reference_date = self.provided_reference_date
-            print(f"Using provided reference date: {reference_date.isoformat()}Z")
-        else:
-            last_join_date = self.cache_handler.load_last_join_date()
-            if last_join_date:
-                reference_date = last_join_date
-                print(f"Using cached reference date: {reference_date.isoformat()}Z")
-            else:
-                reference_date = self.get_user_reference_date()
+        with self.file_handler.open_csv(self.file_path) as csv_file:
+            reference_date = self.resolve_reference_date()
+
+            # Parse, filter and track the latest join date chunk by chunk
+            filtered_members = []
+            total_members = 0
+            latest_date = None
+            chunks = self.file_handler.select_members_chunked(
+                csv_file, reference_date, use_pandas=self.use_pandas
+            )
+            for row_count, chunk in chunks:
+                total_members += row_count
+                if not chunk:
+                    continue
+                filtered_members.extend(chunk)
+                chunk_latest = max(map(attrgetter("join_date"), chunk))
+                if latest_date is None or chunk_latest > latest_date:
+                    latest_date = chunk_latest
 
         if reference_date:
-            filtered_members = [m for m in all_members if m.join_date > reference_date]
-            print(
-                f"Filtered members: {len(filtered_members)} out of {len(all_members)}"
-            )
+            print(f"Filtered members: {len(filtered_members)} out of {total_members}")
         else:
-            filtered_members = all_members
             print(f"Including all members: {len(filtered_members)}")
 
-        if filtered_members:
-            latest_date = max(m.join_date for m in filtered_members)
+        if latest_date is not None:
             self.cache_handler.save_last_join_date(latest_date)
             print(f"Updated last join date to: {latest_date.isoformat()}Z")
         else:
@@ -159,6 +418,18 @@ class MemberProcessor:
 
         return filtered_members
 
+    def resolve_reference_date(self) -> Optional[datetime]:
+        if self.provided_reference_date:
+            reference_date = self.provided_reference_date
+            print(f"Using provided reference date: {reference_date.isoformat()}Z")
+            return reference_date
+
+        last_join_date = self.cache_handler.load_last_join_date()
+        if last_join_date:
+            print(f"Using cached reference date: {last_join_date.isoformat()}Z")
+            return last_join_date
+        return self.get_user_reference_date()
+
     @staticmethod
     def get_user_reference_date() -> Optional[datetime]:
         while True:
@@ -182,30 +453,56 @@ class MemberProcessor:
 # -----------------------------
 # Presentation Layer
 # -----------------------------
+def _format_iso_z(d: datetime) -> str:
+    """
+    Formats a naive UTC datetime as YYYY-MM-DDTHH:MM:SSZ. Equivalent to
+    strftime("%Y-%m-%dT%H:%M:%SZ") without re-parsing the format per row.
+    """
+    return (
+        f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
+        f"T{d.hour:02d}:{d.minute:02d}:{d.second:02d}Z"
+    )
+
+
+def _csv_field(value: str) -> str:
+    """
+    Quotes a field the way csv.writer's default dialect does: only when it
+    contains a delimiter, quote or line break.
+    """
+    if "," in value or '"' in value or "\n" in value or "\r" in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
 class CLI:
+    # Buffer size for the output file and rows encoded per write
+    OUTPUT_BUFFER_SIZE = 1 << 20
+    OUTPUT_ROWS_PER_WRITE = 10_000
+
     @staticmethod
     def write_output(members: List[Member], output_path: str):
         # Sort members by join_date descending
-        members_sorted = sorted(members, key=lambda m: m.join_date, reverse=True)
+        members_sorted = sorted(members, key=attrgetter("join_date"), reverse=True)
 
         fieldnames = ["First Name", "Last Name", "Email", "Join Date", "Profile URL"]
+        # Rows are assembled and UTF-8 encoded in batches rather than passed
+        # through csv.writer one at a time; line endings match csv's "\r\n"
+        batch_size = CLI.OUTPUT_ROWS_PER_WRITE
         try:
-            with open(output_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for member in members_sorted:
-                    writer.writerow(
-                        {
-                            "First Name": member.first_name,
-                            "Last Name": member.last_name,
-                            "Email": member.email,
-                            # Formatting Join Date in ISO 8601 format
-                            "Join Date": member.join_date.strftime(
-                                "%Y-%m-%dT%H:%M:%SZ"
-                            ),
-                            "Profile URL": member.profile_url,
-                        }
-                    )
+            with open(output_path, "wb", buffering=CLI.OUTPUT_BUFFER_SIZE) as f:
+                f.write((",".join(fieldnames) + "\r\n").encode("utf-8"))
+                for start in range(0, len(members_sorted), batch_size):
+                    lines = [
+                        # Join Date is written in ISO 8601 format and never
+                        # needs quoting
+                        f"{_csv_field(first_name)},{_csv_field(last_name)},"
+                        f"{_csv_field(email)},{_format_iso_z(join_date)},"
+                        f"{_csv_field(url)}\r\n"
+                        for first_name, last_name, email, join_date, url in (
+                            members_sorted[start : start + batch_size]
+                        )
+                    ]
+                    f.write("".join(lines).encode("utf-8"))
             print(f"Output written to {output_path}")
         except IOError as e:
             print(f"Failed to write output file: {e}", file=sys.stderr)
@@ -238,6 +535,11 @@ class CLI:
             type=str,
             help="Name of the output CSV file. Defaults to 'output_YYYYMMDD_HHMMSS.csv'.",
         )
+        parser.add_argument(
+            "--pandas",
+            action="store_true",
+            help="Read the input with pandas (must be installed) instead of the csv module.",
+        )
         return parser.parse_args()
 
     @staticmethod
@@ -263,7 +565,7 @@ class CLI:
         else:
             output_file = CLI.generate_default_output_filename()
 
-        processor = MemberProcessor(args.input, reference_date)
+        processor = MemberProcessor(args.input, reference_date, args.pandas)
         try:
             members = processor.process()
             CLI.write_output(members, output_file)
@@ -0,0 +1,52 @@
+import io
+import unittest
+from datetime import datetime
+
+from process import FileHandler
+
+try:
+    import pandas  # noqa: F401
+except ImportError:
+    pandas = None
+
+
+OFFSET_CSV = """User ID,First Name,Last Name,Email,Join Date,Profile URL
+1,Ann,Lee,ann@example.com,2024-09-30T16:56:42+05:00,https://example.com/u/1
+2,Bob,Ray,bob@example.com,2024-10-01T01:00:00+05:00,https://example.com/u/2
+3,Cy,Ng,cy@example.com,2024-10-01T02:00:00Z,https://example.com/u/3
+4,Di,Oh,di@example.com,2024-10-01 03:00:00,https://example.com/u/4
+"""
+
+
+def read_members(joined_after, use_pandas):
+    chunks = FileHandler.select_members_chunked(
+        io.StringIO(OFFSET_CSV, newline=""), joined_after, use_pandas=use_pandas
+    )
+    return [member for _, members in chunks for member in members]
+
+
+@unittest.skipIf(pandas is None, "pandas is not installed")
+class BackendParityTest(unittest.TestCase):
+    def test_offset_dates_match_between_backends(self):
+        for joined_after in (None, datetime(2024, 9, 30, 19, 0)):
+            with self.subTest(joined_after=joined_after):
+                self.assertEqual(
+                    read_members(joined_after, use_pandas=True),
+                    read_members(joined_after, use_pandas=False),
+                )
+
+    def test_offset_dates_are_naive_utc(self):
+        join_dates = [m.join_date for m in read_members(None, use_pandas=True)]
+        self.assertEqual(
+            join_dates,
+            [
+                datetime(2024, 9, 30, 11, 56, 42),
+                datetime(2024, 9, 30, 20, 0),
+                datetime(2024, 10, 1, 2, 0),
+                datetime(2024, 10, 1, 3, 0),
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()